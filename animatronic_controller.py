@@ -31,6 +31,16 @@ class AnimatronicController:
             self.is_connected = self.client.is_connected
             if self.is_connected:
                 print("Successfully connected.")
+                # BlueZ only reports the real MTU after it has been acquired.
+                # This is a diagnostic only, so a failure falls back to the
+                # default mtu_size instead of failing the connection.
+                acquire_mtu = getattr(self.client._backend, "_acquire_mtu", None)
+                if acquire_mtu is not None:
+                    try:
+                        await acquire_mtu()
+                    except Exception as e:
+                        print(f"Could not acquire MTU: {e}")
+                print(f"Negotiated MTU: {self.client.mtu_size} bytes.")
                 # Set up notification handler for responses
                 await self.client.start_notify(
                     RESPONSE_CHARACTERISTIC_UUID, self._handle_data_received
@@ -55,12 +65,13 @@ class AnimatronicController:
 
     async def send_command(self, command):
         """
-        Sends a command to the animatronic via BLE.
+        Sends a command to the animatronic via BLE, without waiting for a
+        write response.
         """
         if self.client and self.client.is_connected:
             print(f"Sending: '{command}'")
             await self.client.write_gatt_char(
-                COMMAND_CHARACTERISTIC_UUID, (command + "\n").encode()
+                COMMAND_CHARACTERISTIC_UUID, (command + "\n").encode(), response=False
             )
         else:
             print("Not connected. Cannot send command.")
@@ -0,0 +1,103 @@
+"""
+Checks that FramePitchShifter.shiftframe still matches stftpitchshift.
+
+FramePitchShifter reimplements StftPitchShift.shiftpitch for a single frame
+and relies on library details such as encode/decode restarting the phase
+accumulator on every call, so run this after upgrading stftpitchshift:
+
+    python check_pitch_shifter.py
+"""
+
+import sys
+
+import numpy as np
+
+import gemini_live_controller
+from gemini_live_controller import (
+    OUTPUT_RATE,
+    PITCH_SHIFT_FRAMESIZE,
+    PITCH_SHIFT_HOPSIZE,
+    PITCH_SHIFT_RATIO,
+    QUEFRENCY_SECONDS,
+    TIMBRE_SHIFT_RATIO,
+    FramePitchShifter,
+)
+
+RANDOM_FRAMES = 50
+# (factor, quefrency, distortion): the controller's settings, plus the
+# no-lifter and identity-timbre paths
+SETTINGS = [
+    (PITCH_SHIFT_RATIO, QUEFRENCY_SECONDS, TIMBRE_SHIFT_RATIO),
+    (PITCH_SHIFT_RATIO, 0, 1),
+    (PITCH_SHIFT_RATIO, QUEFRENCY_SECONDS, 1),
+]
+TOLERANCE = {np.float32: 1e-6, np.float64: 1e-9}
+
+
+def check(rng):
+    """Compares both implementations with the current FFT backend."""
+    failures = 0
+    for factor, quefrency, distortion in SETTINGS:
+        shifter = FramePitchShifter(
+            framesize=PITCH_SHIFT_FRAMESIZE,
+            hopsize=PITCH_SHIFT_HOPSIZE,
+            samplerate=OUTPUT_RATE,
+            factor=factor,
+            quefrency=quefrency,
+            distortion=distortion,
+        )
+        for dtype, tolerance in TOLERANCE.items():
+            frames = [np.zeros(PITCH_SHIFT_FRAMESIZE, dtype=dtype)]
+            frames += [
+                rng.uniform(-1, 1, PITCH_SHIFT_FRAMESIZE).astype(dtype)
+                for _ in range(RANDOM_FRAMES)
+            ]
+            for normalization in (False, True):
+                error = 0.0
+                for frame in frames:
+                    # The library takes log10(0) on silent frames
+                    with np.errstate(divide="ignore", invalid="ignore"):
+                        expected = shifter.shiftpitch(
+                            frame,
+                            factors=factor,
+                            quefrency=quefrency,
+                            distortion=distortion,
+                            normalization=normalization,
+                        )
+                    actual = shifter.shiftframe(frame, normalization=normalization)
+                    if actual.dtype != expected.dtype:
+                        error = np.inf
+                        break
+                    error = max(error, np.abs(actual - expected).max())
+                ok = error <= tolerance
+                failures += not ok
+                print(
+                    f"{'ok  ' if ok else 'FAIL'} factor={factor} "
+                    f"quefrency={quefrency} distortion={distortion} "
+                    f"{dtype.__name__} normalization={normalization}: "
+                    f"max error {error:.3g}"
+                )
+    return failures
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(
+        "FFT backend: numpy.fft"
+        if gemini_live_controller.pyfftw is None
+        else "FFT backend: pyFFTW"
+    )
+    failures = check(rng)
+    if gemini_live_controller.pyfftw is not None:
+        # FramePitchShifter picks its backend when constructed
+        gemini_live_controller.pyfftw = None
+        print("FFT backend: numpy.fft")
+        failures += check(rng)
+    if failures:
+        print(f"{failures} check(s) failed.")
+        sys.exit(1)
+    print("shiftframe matches stftpitchshift.")
+
+
+if __name__ == "__main__":
+    main()
@@ -142,6 +142,15 @@ const uint32_t TALK_PAUSE_DURATION_MAX_MS = 500;    // Max pause between "senten
 const int MAX_COMMAND_LENGTH = 64;
 const char COMMAND_DELIMITER = '\n';
 
+// Connection parameters requested from the central on connect. A short
+// connection interval bounds how quickly commands reach the animatronic.
+// Apple centrals reject Min < 15 ms (and Max < Min + 15 ms unless both are
+// 15 ms), so request exactly 15 ms, which BlueZ accepts as well.
+const uint16_t BLE_CONN_INTERVAL_MIN = 12;    // 15 ms (units of 1.25 ms)
+const uint16_t BLE_CONN_INTERVAL_MAX = 12;    // 15 ms (units of 1.25 ms)
+const uint16_t BLE_CONN_LATENCY = 0;          // Connection events the peripheral may skip
+const uint16_t BLE_CONN_SUPERVISION_TIMEOUT = 400; // 4 s (units of 10 ms)
+
 // =============================================================================
 // ANIMATION CONFIGURATION
 // =============================================================================
@@ -1,8 +1,12 @@
 import argparse
 import asyncio
-import base64
+import json
+import math
 import os
 import queue
+import threading
+import time
+from collections import deque
 from datetime import datetime
 from functools import partial
 
@@ -11,14 +15,25 @@ import pyaudio
 from bleak import BleakClient, BleakScanner
 from google import genai
 from google.genai.types import (
+    Blob,
     LiveConnectConfig,
     Modality,
     PrebuiltVoiceConfig,
     SpeechConfig,
     VoiceConfig,
 )
+from numba import njit
 from stftpitchshift import StftPitchShift
 
+try:
+    import pyfftw
+except ImportError:  # pyFFTW is optional; fall back to numpy.fft
+    pyfftw = None
+
+
+# Per-command BLE and pause/resume logs are only printed with --verbose
+VERBOSE = False
+
 
 def log(message):
     """Prints a message with a timestamp."""
@@ -30,10 +45,20 @@ DEVICE_NAME = "IndianaBones"
 SERVICE_UUID = "0b3a2666-6f1a-4262-9d6d-563a3d6a5867"
 COMMAND_CHARACTERISTIC_UUID = "a5228043-8350-4d13-9842-11a050d7896c"
 RESPONSE_CHARACTERISTIC_UUID = "1ea38cd0-6856-4f15-970a-3931b3b4a83d"
+# The last connected device's address, so later runs can skip the name scan
+DEVICE_CACHE_PATH = os.path.expanduser("~/.cache/indiana_bones/device.json")
+CACHED_DEVICE_SCAN_TIMEOUT = 2.0  # Seconds to look for the cached address
+SCAN_TIMEOUT = 5.0  # Seconds to scan for the animatronic's service
+# Newline-terminated payloads for the commands sent during a session
+COMMAND_BYTES = {
+    command: (command + "\n").encode("ascii")
+    for command in ("start", "stop", "mode dynamic", "talk start", "talk stop")
+}
+MAX_COMMAND_WRITE = 63  # The firmware's MAX_COMMAND_LENGTH (config.h) minus the NUL
 
 # --- Gemini Live and Audio Configuration ---
 # Make sure to set your GOOGLE_API_key environment variable
-# pip install google-generativeai pyaudio webrtcvad pydub
+# pip install google-generativeai pyaudio webrtcvad pydub numba (optionally pyfftw)
 MODEL_ID = "gemini-live-2.5-flash-preview"  # Correct model ID
 AUDIO_FORMAT = pyaudio.paInt16
 CHANNELS = 1
@@ -41,37 +66,523 @@ RATE = 16000  # Sample rate for input audio (must be 8000, 16000, 32000, or 4800
 OUTPUT_RATE = 24000  # Gemini Live API output sample rate
 FRAME_DURATION_MS = 30  # Duration of each audio frame in ms
 CHUNK = int(RATE * FRAME_DURATION_MS / 1000)  # Number of bytes in each audio frame
+AUDIO_MIME_TYPE = f"audio/pcm;rate={RATE}"  # MIME type of the audio sent to Gemini
 SILENCE_FRAMES = 50  # Number of consecutive silent frames to detect end of speech
+PLAYBACK_BUFFER_SECONDS = 0.1  # Audio buffered ahead of the speaker callback
+MIC_QUEUE_MAXSIZE = 10  # Microphone chunks buffered before new ones are dropped
+PITCH_SHIFT_FRAMESIZE = 512  # STFT frame size in samples (~21 ms at OUTPUT_RATE)
+PITCH_SHIFT_HOPSIZE = 128  # STFT analysis hop size in samples
 PITCH_SHIFT_RATIO = 0.76
 TIMBRE_SHIFT_RATIO = 0.9
 QUEFRENCY_SECONDS = 0.003
 TIME_STRETCH_FACTOR = 0.8
 SILENCE_THRESHOLD = 0.01  # RMS threshold for silence detection on float32 audio
-PAUSE_FRAMES_THRESHOLD = 20  # Number of consecutive silent frames to trigger a pause
+PAUSE_FRAMES_THRESHOLD = 40  # Consecutive silent hops (~0.27 s) that trigger a pause
+MIN_PAUSE_RESUME_INTERVAL = 0.05  # Minimum seconds between PAUSE/RESUME commands
+
+# Session setup sent unchanged on every connection
+LIVE_CONNECT_CONFIG = LiveConnectConfig(
+    response_modalities=[Modality.AUDIO],
+    speech_config=SpeechConfig(
+        # language_code="en-US",
+        voice_config=VoiceConfig(
+            prebuilt_voice_config=PrebuiltVoiceConfig(voice_name="Charon")
+        ),
+    ),
+)
+INITIAL_CONTEXT_PROMPT = """You are a spooky animatronic skull named Indiana Bones.
+                                Today is Halloween. Make spooky commentary -- with short French phrases slipped in.
+                                You are talking to kids at the American School of Paris
+                                Add menacing laughs -- 'HaHaHa' -- after your responses.
+                                If spoken to in French, commencer à parler en français avec un accent français pour vos réponses, et dites 'Haw haw haw' au lieu de 'HaHaHa'.
+                                If asked for a joke, the first one to use is 'Why did the skeleton burp? It didn't have the guts to fart. Ha Ha Ha'
+                                If asked where you come from, say you were spawned in the Devil's Workshop (but powered by the Gemini Live API)
+                                # Rules
+                                Limit your answers to 1 sentence, ending with a question appropriate for kids.
+                                """
+INITIAL_CONTEXT_TURNS = [
+    {"role": "user", "parts": [{"text": INITIAL_CONTEXT_PROMPT}]},
+]
+
+
+@njit(cache=True, fastmath=True, boundscheck=False, nogil=True)
+def ola_emit(output_buffer, out_pos, framesize, synthesis_hopsize, int_out):
+    """
+    Converts the next synthesis hop of the OLA buffer to int16 in int_out and
+    advances out_pos, folding the pending tail back to the start of the buffer
+    once another frame would no longer fit. Returns (out_pos, energy), where
+    energy is the sum of squares of the emitted float samples.
+    """
+    energy = 0.0
+    for i in range(synthesis_hopsize):
+        sample = output_buffer[out_pos + i]
+        energy += sample * sample
+        scaled = sample * 32768.0
+        if scaled > 32767.0:
+            scaled = 32767.0
+        elif scaled < -32768.0:
+            scaled = -32768.0
+        int_out[i] = np.int16(scaled)
+
+    out_pos += synthesis_hopsize
+    if out_pos + framesize > output_buffer.shape[0]:
+        tail = output_buffer.shape[0] - out_pos
+        for i in range(tail):
+            output_buffer[i] = output_buffer[out_pos + i]
+        for i in range(tail, output_buffer.shape[0]):
+            output_buffer[i] = 0.0
+        out_pos = 0
+    return out_pos, energy
+
+
+@njit(cache=True, fastmath=True, boundscheck=False, nogil=True)
+def ola_step(output_buffer, out_pos, processed_frame, synthesis_hopsize, int_out):
+    """
+    Overlap-adds processed_frame at out_pos and emits the next synthesis hop,
+    see ola_emit.
+    """
+    framesize = processed_frame.shape[0]
+    for i in range(framesize):
+        output_buffer[out_pos + i] += processed_frame[i]
+    return ola_emit(output_buffer, out_pos, framesize, synthesis_hopsize, int_out)
+
+
+def compile_ola_kernels(framesize):
+    """
+    Runs ola_step once on scratch buffers of play_audio's types, so Numba
+    compiles it and ola_emit up front rather than on the model's first reply.
+    """
+    ola_step(
+        np.zeros(2 * framesize, dtype=np.float32),
+        0,
+        np.zeros(framesize, dtype=np.float32),
+        1,
+        np.empty(1, dtype=np.int16),
+    )
+
+
+FLOAT64_TINY = np.finfo(np.float64).tiny
+
+
+# The vocoder kernels below compile without fastmath, which would let LLVM drop
+# their inf/nan checks.
+@njit(cache=True, boundscheck=False, nogil=True)
+def is_not_normal(x):
+    """stftpitchshift's test for envelope values that can't be divided by."""
+    return math.isinf(x) or math.isnan(x) or abs(x) < FLOAT64_TINY
+
+
+@njit(cache=True, boundscheck=False, nogil=True)
+def resample_linear(x, length, src, weights, out):
+    """
+    Writes the linear resampling of x described by (length, src, weights) to
+    out, see FramePitchShifter._linear_resampler. A negative length copies x.
+    """
+    if length < 0:
+        out[:] = x
+        return
+    for i in range(length):
+        out[i] = weights[i] * x[src[i] + 1] + (1 - weights[i]) * x[src[i]]
+    out[length:] = 0.0
+
+
+@njit(cache=True, boundscheck=False, nogil=True)
+def vocoder_analysis(spectrum, bin_phases, phaseinc, freqinc, magnitudes, frequencies):
+    """
+    Phase vocoder analysis of one frame's spectrum into magnitudes and
+    instantaneous frequencies. Returns the sum of squared magnitudes.
+    """
+    energy = 0.0
+    for i in range(spectrum.shape[0]):
+        value = spectrum[i]
+        magnitude = abs(value)
+        delta = math.atan2(value.imag, value.real) - bin_phases[i]
+        delta = (delta + np.pi) % (2 * np.pi) - np.pi
+        magnitudes[i] = magnitude
+        frequencies[i] = (i + delta / phaseinc) * freqinc
+        energy += magnitude * magnitude
+    return energy
+
+
+@njit(cache=True, boundscheck=False, nogil=True)
+def flatten_envelope(
+    cepstral_spectrum, magnitudes, length, src, weights, scratch, envelope
+):
+    """
+    Divides magnitudes by the formant envelope 10 ** cepstral_spectrum.real and
+    writes the envelope, resampled by (length, src, weights) for the timbre
+    shift, to envelope. Bins where the envelope isn't normal are zeroed.
+    """
+    for i in range(magnitudes.shape[0]):
+        value = 10.0 ** cepstral_spectrum[i].real
+        if is_not_normal(value):
+            magnitudes[i] = 0.0
+            scratch[i] = 0.0
+        else:
+            magnitudes[i] /= value
+            scratch[i] = value
+    resample_linear(scratch, length, src, weights, envelope)
+
+
+@njit(cache=True, boundscheck=False, nogil=True)
+def vocoder_synthesis(
+    magnitudes,
+    frequencies,
+    length,
+    src,
+    weights,
+    factor,
+    nyquist,
+    envelope,
+    energy,
+    phase_scale,
+    shifted_magnitudes,
+    shifted_frequencies,
+    spectrum,
+):
+    """
+    Resamples magnitudes and frequencies by the pitch factor, reapplies the
+    formant envelope (unless it is empty), rescales to the given energy
+    (unless it is negative) and writes the synthesized spectrum, with DC and
+    Nyquist zeroed.
+    """
+    resample_linear(magnitudes, length, src, weights, shifted_magnitudes)
+    resample_linear(frequencies, length, src, weights, shifted_frequencies)
+
+    n = spectrum.shape[0]
+    shifted_energy = 0.0
+    for i in range(n):
+        frequency = shifted_frequencies[i] * factor
+        magnitude = shifted_magnitudes[i]
+        if frequency <= 0 or frequency >= nyquist:
+            magnitude = 0.0
+        if envelope.shape[0]:
+            magnitude *= envelope[i]
+            if is_not_normal(envelope[i]):
+                magnitude = 0.0
+        shifted_frequencies[i] = frequency
+        shifted_magnitudes[i] = magnitude
+        shifted_energy += magnitude * magnitude
+
+    scale = 1.0
+    if energy >= 0 and shifted_energy != 0:
+        scale = math.sqrt(energy / shifted_energy)
+
+    for i in range(n):
+        magnitude = shifted_magnitudes[i] * scale
+        phase = shifted_frequencies[i] * phase_scale
+        spectrum[i] = complex(magnitude * math.cos(phase), magnitude * math.sin(phase))
+    spectrum[0] = 0
+    spectrum[n - 1] = 0
+
+
+class AudioQueue:
+    """
+    A lightweight single-producer/single-consumer queue for handing audio chunks
+    from the asyncio loop to the playback thread. deque append/popleft are
+    atomic under the GIL, so only the consumer's wakeup needs an Event.
+    """
+
+    def __init__(self):
+        self._items = deque()
+        self._ready = threading.Event()
+
+    def put(self, item):
+        self._items.append(item)
+        self._ready.set()
+
+    def get(self):
+        """Blocks until an item is available and returns it."""
+        while not self._items:
+            self._ready.wait()
+            self._ready.clear()
+        return self._items.popleft()
+
+    def empty(self):
+        return not self._items
+
+
+class FramePitchShifter(StftPitchShift):
+    """
+    A StftPitchShift specialized for play_audio, which shifts one frame at a time
+    with fixed pitch, quefrency and timbre settings. shiftframe(frame) gives the
+    same result as shiftpitch(frame, factors=factor, quefrency=quefrency,
+    distortion=distortion), but the windows, bin tables, cepstral lifter and
+    resampling indices are computed once here instead of on every hop, and the
+    per-bin vocoder work between the FFTs runs in Numba-compiled kernels.
+
+    If pyFFTW is installed, the transforms run on FFTW plans measured for this
+    exact frame size; otherwise numpy.fft is used. Either way the spectral math
+    stays in double precision, like stftpitchshift's: at this frame size float32
+    is no faster, and its rounding flips the phase wrap of quiet frames.
+    """
+
+    def __init__(
+        self, framesize, hopsize, samplerate, factor, quefrency=0, distortion=1
+    ):
+        super().__init__(framesize=framesize, hopsize=hopsize, samplerate=samplerate)
+        self.factor = factor
+        self.distortion = distortion
+
+        # Both FFT backends run unnormalized transforms, so the 1/framesize
+        # scaling of stftpitchshift's forward FFTs is folded into the analysis
+        # window and the lifter weights.
+        window = 0.5 - 0.5 * np.cos(2 * np.pi * np.arange(framesize) / framesize)
+        self._analysis_window = window / framesize
+        self._synthesis_window = window * hopsize / np.sum(window * window)
+
+        self._bins = np.arange(framesize // 2 + 1)
+        self._freqinc = samplerate / framesize
+        self._phaseinc = 2 * np.pi * hopsize / framesize
+        self._bin_phases = self._bins * self._phaseinc
+        self._nyquist = samplerate / 2
+
+        # Cepstral lowpass weights for the formant envelope: keep c[0] and
+        # c[q], double c[1:q] and drop everything above the quefrency.
+        q = int(quefrency * samplerate)
+        self._lifter = None
+        if q:
+            self._lifter = np.zeros(framesize)
+            self._lifter[0] = 1
+            self._lifter[1:q] = 2
+            self._lifter[q] = 1
+            self._lifter /= framesize
+
+        self._pitch_resampler = self._linear_resampler(len(self._bins), factor)
+        self._timbre_resampler = self._linear_resampler(len(self._bins), distortion)
+
+        # Per-bin scratch for the vocoder kernels
+        self._magnitudes = np.empty(len(self._bins))
+        self._frequencies = np.empty(len(self._bins))
+        self._envelope_scratch = np.empty(len(self._bins))
+        self._envelope = np.empty(len(self._bins) if q else 0)
+        self._shifted_magnitudes = np.empty(len(self._bins))
+        self._shifted_frequencies = np.empty(len(self._bins))
+        self._spectrum = np.empty(len(self._bins), dtype=np.complex128)
+
+        self._fft = None
+        self._ifft = None
+        if pyfftw is not None:
+            real = pyfftw.empty_aligned(framesize, dtype="float64")
+            complex_ = pyfftw.empty_aligned(len(self._bins), dtype="complex128")
+            self._fft = pyfftw.FFTW(real, complex_, flags=("FFTW_MEASURE",))
+            self._ifft = pyfftw.FFTW(
+                complex_.copy(),
+                real.copy(),
+                direction="FFTW_BACKWARD",
+                flags=("FFTW_MEASURE",),
+            )
+
+        # Numba compiles the vocoder kernels on first use, which takes seconds
+        # on a cold cache; shift a silent frame now so that happens here
+        # rather than on the model's first reply.
+        self.shiftframe(np.zeros(framesize, dtype=np.float32))
+
+    def _rfft(self, x):
+        """
+        Unnormalized real FFT of a frame. With pyFFTW the result is the plan's
+        output array, so it is only valid until the next call.
+        """
+        if self._fft is None:
+            return np.fft.rfft(x)
+        self._fft.input_array[:] = x
+        return self._fft()
+
+    def _irfft(self, spectrum):
+        """Unnormalized inverse real FFT, see _rfft."""
+        if self._ifft is None:
+            return np.fft.irfft(spectrum, norm="forward")
+        self._ifft.input_array[:] = spectrum
+        return self._ifft(normalise_idft=False)
+
+    @staticmethod
+    def _linear_resampler(n, factor):
+        """
+        Precomputes stftpitchshift's linear resampling of n bins by factor as
+        (length, src, weights): y[:length] = x[src] * (1 - w) + x[src + 1] * w.
+        For factor 1, where resampling is the identity, length is -1.
+        """
+        if factor == 1:
+            return -1, np.empty(0, dtype=int), np.empty(0)
+        m = int(n * factor)
+        k = np.arange(min(n, m)) * (n / m)
+        src = np.trunc(k).astype(int)
+        weights = k - src
+        # src is non-decreasing, so the valid indices are a prefix
+        length = np.count_nonzero(src < n - 1)
+        return length, src[:length], weights[:length]
+
+    def shiftframe(self, frame, normalization=False):
+        """
+        Pitch shifts a single frame of self.framesize samples and returns the
+        synthesis-windowed result, ready to be overlap-added.
+        """
+        # Phase vocoder analysis: magnitudes and instantaneous frequencies
+        energy = vocoder_analysis(
+            self._rfft(frame * self._analysis_window),
+            self._bin_phases,
+            self._phaseinc,
+            self._freqinc,
+            self._magnitudes,
+            self._frequencies,
+        )
+
+        if self._lifter is not None:
+            # Flatten the formant envelope so it isn't shifted with the pitch
+            # Silent bins give log10(0) = -inf and a nan cepstrum, which
+            # flatten_envelope treats as not normal, like stftpitchshift does
+            with np.errstate(divide="ignore", invalid="ignore"):
+                log_magnitudes = np.log10(self._magnitudes)
+                cepstrum = self._irfft(log_magnitudes) * self._lifter
+            flatten_envelope(
+                self._rfft(cepstrum),
+                self._magnitudes,
+                *self._timbre_resampler,
+                self._envelope_scratch,
+                self._envelope,
+            )
+
+        # Shift, reapply the envelope and synthesize, zeroing DC and Nyquist
+        # like istft does
+        vocoder_synthesis(
+            self._magnitudes,
+            self._frequencies,
+            *self._pitch_resampler,
+            self.factor,
+            self._nyquist,
+            self._envelope,
+            energy if normalization else -1.0,
+            self._phaseinc / self._freqinc,
+            self._shifted_magnitudes,
+            self._shifted_frequencies,
+            self._spectrum,
+        )
+
+        output = self._irfft(self._spectrum) * self._synthesis_window
+        return output.astype(frame.dtype)
+
+
+class PcmRingBuffer:
+    """
+    A fixed-capacity byte ring buffer between a producer thread and a PortAudio
+    stream callback. write() blocks while the buffer is full, which gives the
+    producer the same backpressure as a blocking stream.write(); read() never
+    blocks and pads with silence on underrun, as an audio callback must. Once
+    close() is called, blocked writers and waiters return immediately.
+    """
+
+    def __init__(self, capacity):
+        self._buffer = memoryview(bytearray(capacity))
+        self._capacity = capacity
+        self._read_pos = 0
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def write(self, data):
+        """Writes all of data, blocking while full; drops it once closed."""
+        data = memoryview(data).cast("B")
+        with self._cond:
+            offset = 0
+            while offset < len(data):
+                while self._size == self._capacity and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                n = min(len(data) - offset, self._capacity - self._size)
+                write_pos = (self._read_pos + self._size) % self._capacity
+                first = min(n, self._capacity - write_pos)
+                self._buffer[write_pos : write_pos + first] = data[
+                    offset : offset + first
+                ]
+                self._buffer[: n - first] = data[offset + first : offset + n]
+                self._size += n
+                offset += n
+
+    def read(self, n):
+        """Returns exactly n bytes, padded with silence if fewer are buffered."""
+        with self._cond:
+            available = min(n, self._size)
+            first = min(available, self._capacity - self._read_pos)
+            # PortAudio needs immutable bytes; in the usual case (no wrap, no
+            # underrun) this slice is the only copy made.
+            out = self._buffer[self._read_pos : self._read_pos + first].tobytes()
+            if first < n:
+                out += self._buffer[: available - first].tobytes()
+                out += bytes(n - available)
+            self._read_pos = (self._read_pos + available) % self._capacity
+            self._size -= available
+            self._cond.notify_all()
+        return out
+
+    def wait_empty(self):
+        """Blocks until everything written has been read, or until closed."""
+        with self._cond:
+            while self._size and not self._closed:
+                self._cond.wait()
+
+    def close(self):
+        """Releases any thread blocked in write() or wait_empty()."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
 
 
 class AnimatronicController:
     def __init__(self):
         self.client = None
         self.is_connected = False
+        # Commands waiting for an in-flight BLE write to finish
+        self._pending_commands = deque()
+        self._inflight_command = None
+        self._sending = False
 
     async def connect(self):
         """
         Scans for the animatronic device and establishes a BLE connection.
+        The address of the last connected device is tried first, falling back
+        to a scan for the first device advertising the animatronic service.
         """
-        log(f"Scanning for '{DEVICE_NAME}'...")
-        device = await BleakScanner.find_device_by_name(DEVICE_NAME)
+        device = None
+        cached_address = self._load_cached_address()
+        if cached_address:
+            log(f"Looking for cached device {cached_address}...")
+            device = await BleakScanner.find_device_by_address(
+                cached_address, timeout=CACHED_DEVICE_SCAN_TIMEOUT
+            )
+        if device is None:
+            # The service UUID is in the advertisement itself, so matching on
+            # it needs no scan response round-trip, unlike the device name.
+            log(f"Scanning for '{DEVICE_NAME}'...")
+            device = await BleakScanner.find_device_by_filter(
+                lambda d, adv: SERVICE_UUID in adv.service_uuids,
+                timeout=SCAN_TIMEOUT,
+                service_uuids=[SERVICE_UUID],
+            )
         if device is None:
-            log(f"Could not find device with name '{DEVICE_NAME}'.")
+            log(f"Could not find '{DEVICE_NAME}' advertising service {SERVICE_UUID}.")
             return False
 
         log(f"Connecting to '{device.name}' ({device.address})...")
-        self.client = BleakClient(device)
+        self.client = BleakClient(
+            device, disconnected_callback=self._handle_disconnected
+        )
         try:
             await self.client.connect()
             self.is_connected = self.client.is_connected
             if self.is_connected:
                 log("Successfully connected.")
+                self._save_cached_address(device.address)
+                # BlueZ only reports the real MTU after it has been acquired.
+                # This is a diagnostic only, so a failure falls back to the
+                # default mtu_size instead of failing the connection.
+                acquire_mtu = getattr(self.client._backend, "_acquire_mtu", None)
+                if acquire_mtu is not None:
+                    try:
+                        await acquire_mtu()
+                    except Exception as e:
+                        log(f"Could not acquire MTU: {e}")
+                log(f"Negotiated MTU: {self.client.mtu_size} bytes.")
                 await self.client.start_notify(
                     RESPONSE_CHARACTERISTIC_UUID, self._handle_data_received
                 )
@@ -83,6 +594,24 @@ class AnimatronicController:
             log(f"Failed to connect: {e}")
             return False
 
+    @staticmethod
+    def _load_cached_address():
+        """Returns the cached device address, or None if there is none."""
+        try:
+            with open(DEVICE_CACHE_PATH) as f:
+                return json.load(f).get("address")
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    @staticmethod
+    def _save_cached_address(address):
+        try:
+            os.makedirs(os.path.dirname(DEVICE_CACHE_PATH), exist_ok=True)
+            with open(DEVICE_CACHE_PATH, "w") as f:
+                json.dump({"name": DEVICE_NAME, "address": address}, f)
+        except OSError as e:
+            log(f"Could not cache device address: {e}")
+
     async def disconnect(self):
         """
         Closes the BLE connection.
@@ -96,20 +625,74 @@ class AnimatronicController:
     async def send_command(self, command):
         """
         Sends a command to the animatronic via BLE.
+
+        Commands are written without response so the BLE stack can pipeline
+        them. While a write is in flight, new commands are queued, and a command
+        identical to the last queued (or in-flight) one is collapsed into it.
+        Queued commands are then sent together, newline-separated, in as few
+        writes as fit the MTU and the firmware's command buffer.
         """
-        if self.client and self.client.is_connected:
-            log(f"Sending: '{command}'")
-            await self.client.write_gatt_char(
-                COMMAND_CHARACTERISTIC_UUID, (command + "\n").encode()
+        # is_connected is kept current by connect(), disconnect() and
+        # _handle_disconnected, so the hot path needn't ask bleak
+        if self.is_connected:
+            last_command = (
+                self._pending_commands[-1]
+                if self._pending_commands
+                else self._inflight_command
             )
+            if last_command == command:
+                return
+            self._pending_commands.append(command)
+            if self._sending:
+                return
+
+            self._sending = True
+            try:
+                # A write without response must fit in one ATT packet
+                limit = min(self.client.mtu_size - 3, MAX_COMMAND_WRITE)
+                while self._pending_commands:
+                    batch = [self._pending_commands.popleft()]
+                    payload = bytearray(self._encode_command(batch[0]))
+                    while self._pending_commands:
+                        encoded = self._encode_command(self._pending_commands[0])
+                        if len(payload) + len(encoded) > limit:
+                            break
+                        payload += encoded
+                        batch.append(self._pending_commands.popleft())
+                    self._inflight_command = batch[-1]
+                    if VERBOSE:
+                        log("Sending: " + ", ".join(f"'{c}'" for c in batch))
+                    await self.client.write_gatt_char(
+                        COMMAND_CHARACTERISTIC_UUID, payload, response=False
+                    )
+            except Exception:
+                # Don't replay stale commands after a failed write
+                self._pending_commands.clear()
+                raise
+            finally:
+                self._inflight_command = None
+                self._sending = False
         else:
             log("Not connected. Cannot send command.")
 
+    @staticmethod
+    def _encode_command(command):
+        return COMMAND_BYTES.get(command) or (command + "\n").encode()
+
     def _handle_data_received(self, sender, data):
         """
         Callback function to handle data received from the animatronic.
         """
-        log(f"Received: '{data.decode().strip()}'")
+        if VERBOSE:
+            log(f"Received: '{data.decode().strip()}'")
+
+    def _handle_disconnected(self, client):
+        """
+        Callback function for when the BLE link drops or is closed.
+        """
+        if self.is_connected:
+            self.is_connected = False
+            log("Connection lost.")
 
 
 class DummyAnimatronicController:
@@ -131,10 +714,11 @@ class DummyAnimatronicController:
         log(f"Running in --no-ble mode. Mock sending command: '{command}'")
 
 
-async def gemini_live_interaction(controller):
+async def gemini_live_interaction(controller, audio):
     """
     Handles the Gemini Live API interaction, including sending and receiving audio,
-    and controlling the animatronic based on voice activity.
+    and controlling the animatronic based on voice activity. audio is a PyAudio
+    instance owned by the caller, so PortAudio is only initialized once per run.
     """
     api_key = os.getenv("GEMINI_API_KEY")
     if not api_key:
@@ -142,7 +726,45 @@ async def gemini_live_interaction(controller):
         return
 
     client = genai.Client(api_key=api_key)
-    audio = pyaudio.PyAudio()
+
+    # Build the pitch shifter and compile the playback kernels before
+    # connecting, so the first reply doesn't wait on Numba.
+    pitch_shifter = FramePitchShifter(
+        framesize=PITCH_SHIFT_FRAMESIZE,
+        hopsize=PITCH_SHIFT_HOPSIZE,
+        samplerate=OUTPUT_RATE,
+        factor=PITCH_SHIFT_RATIO,
+        quefrency=QUEFRENCY_SECONDS,
+        distortion=TIMBRE_SHIFT_RATIO,
+    )
+    compile_ola_kernels(PITCH_SHIFT_FRAMESIZE)
+
+    loop = asyncio.get_running_loop()
+    bytes_per_frame = audio.get_sample_size(AUDIO_FORMAT) * CHANNELS
+
+    # Both streams run in PortAudio callback mode: the microphone hands each
+    # chunk to the event loop, and the speaker pulls from a ring buffer that
+    # play_audio fills, so no Python thread has to wake up per chunk.
+    mic_queue = asyncio.Queue(maxsize=MIC_QUEUE_MAXSIZE)
+    model_is_speaking = asyncio.Event()
+    playback_buffer = PcmRingBuffer(
+        int(OUTPUT_RATE * PLAYBACK_BUFFER_SECONDS) * bytes_per_frame
+    )
+
+    def enqueue_mic_chunk(data):
+        # Drop the chunk rather than grow without bound if send_audio stalls
+        if not mic_queue.full():
+            mic_queue.put_nowait(data)
+
+    def mic_callback(in_data, frame_count, time_info, status):
+        # Nothing is sent while the model speaks, so don't wake the loop for
+        # it; is_set() is a plain attribute read, safe from this thread.
+        if not model_is_speaking.is_set():
+            loop.call_soon_threadsafe(enqueue_mic_chunk, in_data)
+        return (None, pyaudio.paContinue)
+
+    def speaker_callback(in_data, frame_count, time_info, status):
+        return (playback_buffer.read(frame_count * bytes_per_frame), pyaudio.paContinue)
 
     input_stream = audio.open(
         format=AUDIO_FORMAT,
@@ -150,6 +772,8 @@ async def gemini_live_interaction(controller):
         rate=RATE,
         input=True,
         frames_per_buffer=CHUNK,
+        stream_callback=mic_callback,
+        start=False,
     )
 
     output_stream = audio.open(
@@ -157,71 +781,46 @@ async def gemini_live_interaction(controller):
         channels=CHANNELS,
         rate=OUTPUT_RATE,
         output=True,
+        stream_callback=speaker_callback,
     )
 
     try:
         log("Connecting to Gemini Live...")
         async with client.aio.live.connect(
             model=MODEL_ID,
-            config=LiveConnectConfig(
-                response_modalities=[Modality.AUDIO],
-                speech_config=SpeechConfig(
-                    # language_code="en-US",
-                    voice_config=VoiceConfig(
-                        prebuilt_voice_config=PrebuiltVoiceConfig(voice_name="Charon")
-                    ),
-                ),
-            ),
+            config=LIVE_CONNECT_CONFIG,
         ) as session:
             log("Successfully connected to Gemini Live. Speak now...")
 
             # Send the initial context message
-            await session.send_client_content(
-                turns=[
-                    {
-                        "role": "user",
-                        "parts": [
-                            {
-                                "text": """You are a spooky animatronic skull named Indiana Bones.
-                                Today is Halloween. Make spooky commentary -- with short French phrases slipped in.
-                                You are talking to kids at the American School of Paris
-                                Add menacing laughs -- 'HaHaHa' -- after your responses.
-                                If spoken to in French, commencer à parler en français avec un accent français pour vos réponses, et dites 'Haw haw haw' au lieu de 'HaHaHa'.
-                                If asked for a joke, the first one to use is 'Why did the skeleton burp? It didn't have the guts to fart. Ha Ha Ha'
-                                If asked where you come from, say you were spawned in the Devil's Workshop (but powered by the Gemini Live API)
-                                # Rules
-                                Limit your answers to 1 sentence, ending with a question appropriate for kids.
-                                """
-                            }
-                        ],
-                    }
-                ]
-            )
+            await session.send_client_content(turns=INITIAL_CONTEXT_TURNS)
 
-            model_is_speaking = asyncio.Event()
             first_audio_played = asyncio.Event()
             flush_complete_event = asyncio.Event()
-            audio_in_queue = queue.Queue()
+            audio_in_queue = AudioQueue()
+            # Bounded, so shift_audio blocks once it is a few frames ahead
+            processed_frames = queue.Queue(maxsize=4)
             animatronic_state_queue = asyncio.Queue()
-            loop = asyncio.get_running_loop()
-
-            # Initialize the pitch shifter
-            pitch_shifter = StftPitchShift(
-                framesize=1024, hopsize=256, samplerate=OUTPUT_RATE
-            )
 
             async def send_audio(model_is_speaking_event):
+                # Only start capturing once the session is up, so no stale
+                # audio queues up while connecting.
+                input_stream.start_stream()
+                # One Blob is reused for every chunk: send_realtime_input
+                # serializes it before returning, and a model instance skips
+                # the dict validation the SDK would otherwise redo per chunk.
+                audio_blob = Blob(mime_type=AUDIO_MIME_TYPE)
+                # Bind the per-chunk methods once, outside the loop
+                next_chunk = mic_queue.get
+                is_model_speaking = model_is_speaking_event.is_set
+                send_realtime_input = session.send_realtime_input
                 while True:
-                    data = await asyncio.to_thread(
-                        lambda: input_stream.read(CHUNK, exception_on_overflow=False)
-                    )
-                    if not model_is_speaking_event.is_set():
-                        await session.send_realtime_input(
-                            media={
-                                "mime_type": f"audio/pcm;rate={RATE}",
-                                "data": base64.b64encode(data).decode("utf-8"),
-                            }
-                        )
+                    data = await next_chunk()
+                    if is_model_speaking():
+                        continue
+                    # The SDK takes raw PCM bytes and does the wire encoding
+                    audio_blob.data = data
+                    await send_realtime_input(media=audio_blob)
 
             async def receive_audio(
                 model_is_speaking_event,
@@ -229,7 +828,13 @@ async def gemini_live_interaction(controller):
                 first_audio_played_event,
                 anim_queue,
                 flush_complete_event,
+                spawn,
             ):
+                """
+                Forwards Gemini's audio to shift_audio and, at the end of each
+                turn, waits for playback to finish before stopping the talking
+                animation. spawn schedules a coroutine as a task of the session.
+                """
                 while True:
                     async for message in session.receive():
                         if message.data is not None:
@@ -243,27 +848,106 @@ async def gemini_live_interaction(controller):
                             and message.server_content.turn_complete
                         ):
                             if model_is_speaking_event.is_set():
-                                # Wait for the audio queue to drain to avoid clipping.
-                                while not queue.empty():
-                                    await asyncio.sleep(0.01)
-
                                 # Send a flush command to the play_audio thread
-                                # and wait for it to complete.
+                                # and wait for it to complete. The queue is FIFO,
+                                # so the flush only runs once all the audio
+                                # before it has been shifted and played.
                                 flush_complete_event.clear()
                                 queue.put("FLUSH")
                                 await flush_complete_event.wait()
 
-                                # Clear animatronic queue and stop talking
+                                # Clear animatronic queue and stop talking. The
+                                # write runs as its own task so the microphone
+                                # reopens without waiting on BLE; the session's
+                                # TaskGroup keeps it referenced and surfaces any
+                                # error.
                                 while not anim_queue.empty():
                                     anim_queue.get_nowait()
-                                await controller.send_command("talk stop")
+                                spawn(controller.send_command("talk stop"))
                                 log("Model finished speaking.")
                                 model_is_speaking_event.clear()
                                 first_audio_played_event.clear()
 
+            def shift_audio(queue, pitch_shifter, processed_frames):
+                """
+                Pitch shifts audio chunks from a queue frame by frame and hands the
+                processed frames to play_audio through processed_frames, so the
+                STFT work overlaps with playback. A FLUSH from receive_audio is
+                forwarded as ("FLUSH", final_frame), where final_frame is the padded
+                remainder of the utterance or None.
+                """
+                # The input is a ring buffer: unread samples live in
+                # ring[read_idx:write_idx] and frames are taken as views of it.
+                ring = np.empty(4 * pitch_shifter.framesize, dtype=np.float32)
+                read_idx = 0
+                write_idx = 0
+
+                def make_room(n):
+                    """Ensures n samples fit at write_idx without wrapping."""
+                    nonlocal ring, read_idx, write_idx
+                    if write_idx + n <= len(ring):
+                        return
+                    # Fold the unread tail back to the start of the ring; this
+                    # only happens every few frames, so it's amortized O(1).
+                    pending = write_idx - read_idx
+                    if pending + n > len(ring):
+                        # Gemini sent a chunk larger than the ring; grow it.
+                        grown = np.empty(
+                            pending + n + pitch_shifter.framesize, dtype=np.float32
+                        )
+                        grown[:pending] = ring[read_idx:write_idx]
+                        ring = grown
+                    else:
+                        ring[:pending] = ring[read_idx:write_idx]
+                    read_idx, write_idx = 0, pending
+
+                while True:
+                    chunk_bytes = queue.get()
+                    if chunk_bytes is None:
+                        processed_frames.put(None)
+                        break
+
+                    if chunk_bytes == "FLUSH":
+                        final_frame = None
+                        pending = write_idx - read_idx
+                        if pending > 0:
+                            # Pad the remaining input to a full frame
+                            make_room(pitch_shifter.framesize - pending)
+                            frame_end = read_idx + pitch_shifter.framesize
+                            ring[write_idx:frame_end] = 0.0
+                            final_frame = pitch_shifter.shiftframe(
+                                ring[read_idx:frame_end], normalization=True
+                            )
+
+                        # Reset the ring for the next utterance
+                        read_idx = write_idx = 0
+                        processed_frames.put(("FLUSH", final_frame))
+                        continue
+
+                    # 1. Accumulate new audio data (convert to float32) in the ring
+                    samples = np.frombuffer(chunk_bytes, dtype=np.int16)
+                    make_room(len(samples))
+                    np.multiply(
+                        samples,
+                        np.float32(1.0 / 32768.0),
+                        out=ring[write_idx : write_idx + len(samples)],
+                        dtype=np.float32,
+                    )
+                    write_idx += len(samples)
+
+                    # 2. Pitch shift all available full frames (windowing is
+                    # handled internally); frames are views into the ring
+                    while write_idx - read_idx >= pitch_shifter.framesize:
+                        processed_frames.put(
+                            pitch_shifter.shiftframe(
+                                ring[read_idx : read_idx + pitch_shifter.framesize]
+                            )
+                        )
+                        read_idx += pitch_shifter.hopsize
+
             def play_audio(
-                queue,
-                stream,
+                processed_frames,
+                playback_buffer,
                 pitch_shifter,
                 first_audio_played_event,
                 flush_complete_event,
@@ -271,129 +955,90 @@ async def gemini_live_interaction(controller):
                 anim_queue,
             ):
                 """
-                Plays audio chunks from a queue, applying pitch shifting and time stretching
+                Plays pitch-shifted frames from shift_audio, applying time stretching
                 using the correct Overlap-Add (OLA) method for smooth, glitch-free audio.
                 Note: Time stretching with this method might introduce some audible artifacts
                 as it doesn't perform phase locking.
                 """
-                # Buffers for OLA processing, using float32 for audio processing
-                input_buffer = np.array([], dtype=np.float32)
-                output_buffer = np.zeros(pitch_shifter.framesize, dtype=np.float32)
+                # The output is twice the frame size; frames are overlap-added at
+                # out_pos, which advances by a synthesis hop instead of shifting
+                # the whole buffer, and is folded back to the start when full.
+                output_buffer = np.zeros(2 * pitch_shifter.framesize, dtype=np.float32)
+                out_pos = 0
                 is_currently_silent = False
                 silence_frames_count = 0
 
-                analysis_hopsize = pitch_shifter.hopsize
                 # To slow down, synthesis hopsize must be smaller than analysis hopsize.
-                synthesis_hopsize = int(analysis_hopsize / TIME_STRETCH_FACTOR)
+                synthesis_hopsize = int(pitch_shifter.hopsize / TIME_STRETCH_FACTOR)
+                # rms < SILENCE_THRESHOLD, squared and scaled to a sum of squares
+                silence_energy_threshold = SILENCE_THRESHOLD**2 * synthesis_hopsize
+
+                # Scratch buffer for the int16 output of each synthesis hop
+                int_scratch = np.empty(synthesis_hopsize, dtype=np.int16)
 
                 while True:
-                    chunk_bytes = queue.get(block=True)
-                    if chunk_bytes is None:
+                    processed_frame = processed_frames.get()
+                    if processed_frame is None:
                         break
 
-                    if chunk_bytes == "FLUSH":
-                        if len(input_buffer) > 0:
-                            # Pad the remaining input to a full frame
-                            padding = np.zeros(
-                                pitch_shifter.framesize - len(input_buffer),
-                                dtype=np.float32,
-                            )
-                            frame = np.concatenate((input_buffer, padding))
-
-                            # Process this final frame
-                            processed_frame = pitch_shifter.shiftpitch(
-                                frame,
-                                factors=PITCH_SHIFT_RATIO,
-                                quefrency=QUEFRENCY_SECONDS,
-                                distortion=TIMBRE_SHIFT_RATIO,
-                                normalization=True,
-                            )
-                            output_buffer += processed_frame
+                    if isinstance(processed_frame, tuple):
+                        _, final_frame = processed_frame
+                        if final_frame is not None:
+                            output_buffer[
+                                out_pos : out_pos + pitch_shifter.framesize
+                            ] += final_frame
 
                             # Write out the entire remaining output buffer in hops
                             remaining_samples = pitch_shifter.framesize
                             while remaining_samples > 0:
-                                segment_to_write = output_buffer[:synthesis_hopsize]
-                                output_segment_int = (
-                                    segment_to_write * 32768.0
-                                ).astype(np.int16)
-                                stream.write(output_segment_int.tobytes())
-
-                                output_buffer = np.roll(
-                                    output_buffer, -synthesis_hopsize
+                                out_pos, _ = ola_emit(
+                                    output_buffer,
+                                    out_pos,
+                                    pitch_shifter.framesize,
+                                    synthesis_hopsize,
+                                    int_scratch,
                                 )
-                                output_buffer[-synthesis_hopsize:] = 0.0
+                                playback_buffer.write(int_scratch)
                                 remaining_samples -= synthesis_hopsize
 
                         # Reset buffers for the next utterance
-                        input_buffer = np.array([], dtype=np.float32)
                         output_buffer.fill(0.0)
+                        out_pos = 0
 
-                        # Signal completion
+                        # Signal completion once the speaker has played it all
+                        playback_buffer.wait_empty()
                         loop.call_soon_threadsafe(flush_complete_event.set)
                         continue
 
-                    # 1. Accumulate new audio data (convert to float32)
-                    new_chunk = (
-                        np.frombuffer(chunk_bytes, dtype=np.int16).astype(np.float32)
-                        / 32768.0
+                    # 1. Overlap-add the processed frame, convert the next hop
+                    # to int16 and advance the output position (JIT-compiled)
+                    out_pos, energy = ola_step(
+                        output_buffer,
+                        out_pos,
+                        processed_frame,
+                        synthesis_hopsize,
+                        int_scratch,
                     )
-                    input_buffer = np.concatenate((input_buffer, new_chunk))
-
-                    # 2. Process all available full frames
-                    while len(input_buffer) >= pitch_shifter.framesize:
-                        # a. Get the next frame
-                        current_frame = input_buffer[: pitch_shifter.framesize]
-
-                        # b. Perform pitch shifting (windowing is handled internally)
-                        processed_frame = pitch_shifter.shiftpitch(
-                            current_frame,
-                            factors=PITCH_SHIFT_RATIO,
-                            quefrency=QUEFRENCY_SECONDS,
-                            distortion=TIMBRE_SHIFT_RATIO,
-                            normalization=False,
-                        )
-
-                        # c. Add the processed frame to the output buffer (Overlap-Add)
-                        output_buffer += processed_frame
-
-                        # d. Send the first hop_size of the result to the speaker
-                        output_segment_float = output_buffer[:synthesis_hopsize]
-
-                        # Silence detection
-                        rms = np.sqrt(np.mean(output_segment_float**2))
-                        if rms < SILENCE_THRESHOLD:
-                            silence_frames_count += 1
-                            if (
-                                silence_frames_count > PAUSE_FRAMES_THRESHOLD
-                                and not is_currently_silent
-                            ):
-                                is_currently_silent = True
-                                loop.call_soon_threadsafe(
-                                    anim_queue.put_nowait, "PAUSE"
-                                )
-                        else:
-                            if is_currently_silent:
-                                is_currently_silent = False
-                                loop.call_soon_threadsafe(
-                                    anim_queue.put_nowait, "RESUME"
-                                )
-                            silence_frames_count = 0
 
-                        output_segment_int = (output_segment_float * 32768.0).astype(
-                            np.int16
-                        )
-                        stream.write(output_segment_int.tobytes())
-                        if not first_audio_played_event.is_set():
-                            loop.call_soon_threadsafe(first_audio_played_event.set)
-
-                        # e. Slide the output buffer left
-                        output_buffer = np.roll(output_buffer, -synthesis_hopsize)
-                        # Clear the end of the buffer that was just slid over
-                        output_buffer[-synthesis_hopsize:] = 0.0
+                    # 2. Silence detection on the emitted hop
+                    if energy < silence_energy_threshold:
+                        silence_frames_count += 1
+                        if (
+                            silence_frames_count > PAUSE_FRAMES_THRESHOLD
+                            and not is_currently_silent
+                        ):
+                            is_currently_silent = True
+                            loop.call_soon_threadsafe(anim_queue.put_nowait, "PAUSE")
+                    else:
+                        if is_currently_silent:
+                            is_currently_silent = False
+                            loop.call_soon_threadsafe(anim_queue.put_nowait, "RESUME")
+                        silence_frames_count = 0
 
-                        # f. Slide the input buffer left
-                        input_buffer = input_buffer[analysis_hopsize:]
+                    # 3. Queue the hop for the speaker callback
+                    playback_buffer.write(int_scratch)
+                    if not first_audio_played_event.is_set():
+                        loop.call_soon_threadsafe(first_audio_played_event.set)
 
             async def manage_animatronic_talking(
                 model_is_speaking_event,
@@ -407,10 +1052,13 @@ async def gemini_live_interaction(controller):
                     await first_audio_played_event.wait()
 
                     # Check if the utterance is still active before starting
+                    last_state = None
                     if model_is_speaking_event.is_set():
                         log("Starting animatronic for utterance.")
                         await controller.send_command("talk start")
                         # await controller.send_command("home")
+                        last_state = "RESUME"
+                    last_sent_time = time.monotonic()
 
                     # Manage pauses during the utterance
                     while model_is_speaking_event.is_set():
@@ -419,17 +1067,38 @@ async def gemini_live_interaction(controller):
                             state = await asyncio.wait_for(
                                 anim_queue.get(), timeout=0.1
                             )
-                            if state == "PAUSE":
-                                log("Pausing animatronic due to silence.")
-                                await controller.send_command("talk stop")
-                            elif state == "RESUME":
-                                log("Resuming animatronic.")
-                                await controller.send_command("talk start")
-                            anim_queue.task_done()
                         except asyncio.TimeoutError:
                             # Timeout is fine, just means no state change
                             continue
 
+                        # Rate-limit transitions, then collapse any backlog
+                        # to the latest state so choppy audio can't flood BLE.
+                        delay = (
+                            last_sent_time
+                            + MIN_PAUSE_RESUME_INTERVAL
+                            - time.monotonic()
+                        )
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+                        while not anim_queue.empty():
+                            state = anim_queue.get_nowait()
+                        # The turn may have ended (and sent "talk stop") meanwhile
+                        if not model_is_speaking_event.is_set():
+                            break
+                        if state == last_state:
+                            continue
+
+                        if state == "PAUSE":
+                            if VERBOSE:
+                                log("Pausing animatronic due to silence.")
+                            await controller.send_command("talk stop")
+                        elif state == "RESUME":
+                            if VERBOSE:
+                                log("Resuming animatronic.")
+                            await controller.send_command("talk start")
+                        last_state = state
+                        last_sent_time = time.monotonic()
+
             async with asyncio.TaskGroup() as tg:
                 tg.create_task(send_audio(model_is_speaking))
                 tg.create_task(
@@ -439,14 +1108,23 @@ async def gemini_live_interaction(controller):
                         first_audio_played,
                         animatronic_state_queue,
                         flush_complete_event,
+                        tg.create_task,
+                    )
+                )
+                tg.create_task(
+                    asyncio.to_thread(
+                        shift_audio,
+                        audio_in_queue,
+                        pitch_shifter,
+                        processed_frames,
                     )
                 )
                 tg.create_task(
                     asyncio.to_thread(
                         partial(
                             play_audio,
-                            audio_in_queue,
-                            output_stream,
+                            processed_frames,
+                            playback_buffer,
                             pitch_shifter,
                             first_audio_played,
                             flush_complete_event,
@@ -473,13 +1151,14 @@ async def gemini_live_interaction(controller):
         log("Closing streams.")
         if "audio_in_queue" in locals():
             audio_in_queue.put(None)  # Signal the play_audio thread to exit
+        # Unblock play_audio before the speaker callback stops draining
+        playback_buffer.close()
         if input_stream.is_active():
             input_stream.stop_stream()
         input_stream.close()
         if "output_stream" in locals() and output_stream.is_active():
             output_stream.stop_stream()
             output_stream.close()
-        audio.terminate()
 
 
 async def main():
@@ -492,22 +1171,36 @@ async def main():
         action="store_true",
         help="Run without connecting to the BLE device.",
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Log every BLE command, response and pause/resume.",
+    )
     args = parser.parse_args()
 
+    global VERBOSE
+    VERBOSE = args.verbose
+
     if args.no_ble:
         controller = DummyAnimatronicController()
     else:
         controller = AnimatronicController()
 
-    if await controller.connect():
-        try:
-            await controller.send_command("start")
-            await controller.send_command("mode dynamic")
-            await gemini_live_interaction(controller)
-        finally:
-            log("Exiting program.")
-            await controller.send_command("stop")
-            await controller.disconnect()
+    # Initialize PortAudio (which probes the audio devices) while scanning
+    audio_task = asyncio.create_task(asyncio.to_thread(pyaudio.PyAudio))
+    try:
+        if await controller.connect():
+            audio = await audio_task
+            try:
+                await controller.send_command("start")
+                await controller.send_command("mode dynamic")
+                await gemini_live_interaction(controller, audio)
+            finally:
+                log("Exiting program.")
+                await controller.send_command("stop")
+                await controller.disconnect()
+    finally:
+        (await audio_task).terminate()
 
 
 if __name__ == "__main__":
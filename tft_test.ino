@@ -334,6 +334,16 @@ class MyServerCallbacks: public BLEServerCallbacks {
       deviceConnected = true;
     };
 
+    void onConnect(BLEServer* pServer, esp_ble_gatts_cb_param_t *param) {
+      // Ask the central for a short connection interval so commands like
+      // "talk start"/"talk stop" are delivered with minimal latency.
+      pServer->updateConnParams(param->connect.remote_bda,
+                                BLE_CONN_INTERVAL_MIN,
+                                BLE_CONN_INTERVAL_MAX,
+                                BLE_CONN_LATENCY,
+                                BLE_CONN_SUPERVISION_TIMEOUT);
+    };
+
     void onDisconnect(BLEServer* pServer) {
       deviceConnected = false;
     }
@@ -348,15 +358,26 @@ class CommandCharacteristicCallbacks: public BLECharacteristicCallbacks {
         strncpy(commandBuffer, value.c_str(), MAX_COMMAND_LENGTH - 1);
         commandBuffer[MAX_COMMAND_LENGTH - 1] = '\0'; // Ensure null termination
 
-        // Strip trailing whitespace (like the newline from the python script)
-        int len = strlen(commandBuffer);
-        while (len > 0 && isspace(commandBuffer[len - 1])) {
-            commandBuffer[--len] = '\0';
-        }
+        // The python script may batch several newline-terminated commands
+        // into one write, so process each line in turn
+        char *line = commandBuffer;
+        while (line != NULL && *line != '\0') {
+            char *next = strchr(line, '\n');
+            if (next != NULL) {
+                *next++ = '\0';
+            }
 
-        // Process the command if it's not empty after stripping
-        if (strlen(commandBuffer) > 0) {
-            processBluetoothCommand(commandBuffer);
+            // Strip trailing whitespace (like a '\r' before the newline)
+            int len = strlen(line);
+            while (len > 0 && isspace(line[len - 1])) {
+                line[--len] = '\0';
+            }
+
+            // Process the command if it's not empty after stripping
+            if (len > 0) {
+                processBluetoothCommand(line);
+            }
+            line = next;
         }
       }
     }
@@ -702,10 +723,12 @@ void setup()
     // Create the BLE Service
     BLEService *pService = pServer->createService(SERVICE_UUID);
 
-    // Create a BLE Characteristic for commands
+    // Create a BLE Characteristic for commands. Write without response lets
+    // the client pipeline commands instead of waiting for an ATT response.
     pCommandCharacteristic = pService->createCharacteristic(
                                         COMMAND_CHARACTERISTIC_UUID,
-                                        BLECharacteristic::PROPERTY_WRITE
+                                        BLECharacteristic::PROPERTY_WRITE |
+                                        BLECharacteristic::PROPERTY_WRITE_NR
                                     );
     pCommandCharacteristic->setCallbacks(new CommandCharacteristicCallbacks());
 